@@ -1,3 +1,4 @@
+import pytest
 from pytest import approx
 
 from barril import units
@@ -555,3 +556,156 @@ def testCrystallizationKineticRate() -> None:
     default = units.Scalar("crystallization kinetic rate", 1.0, "mol/m2.s.Pa")
     assert default.value == 1.0
     assert default.GetValue("mol/m2.s.Pa") == 1.0
+
+
+def testPoscConversionOfInfinity() -> None:
+    inf = float("inf")
+    assert units.Scalar("length", inf, "m").GetValue("ft") == inf
+    assert units.Scalar("length", -inf, "ft").GetValue("m") == -inf
+    assert units.Scalar("temperature", inf, "degC").GetValue("K") == inf
+
+
+@pytest.mark.parametrize(
+    "coefficients",
+    [
+        (0.0, 0.3048, 1.0, 0.0),
+        (0.0, 1, 0.3048, 0.0),
+        (0.0, 1, 86400, 0.0),
+        (0.0, 1, 1.0, 0.0),
+        (0.0, 5, 9, 0),
+        (273.15, 1, 1, 0),
+        (101325, 6894.757, 1, 0),
+        (1.0, 2.0, 3.0, 4.0),
+    ],
+)
+def testPoscConversionFunctions(coefficients) -> None:
+    """
+    The conversion functions skip constant operations, but must give the exact same results as the
+    full formulas (including the sign of zero and converting integers to floats).
+    """
+    import struct
+
+    from barril.units.posc import MakeBaseToCustomary
+    from barril.units.posc import MakeCustomaryToBase
+
+    a, b, c, d = coefficients
+    f_unit_to_base = MakeCustomaryToBase(a, b, c, d)
+    f_base_to_unit = MakeBaseToCustomary(a, b, c, d)
+    for value in (0, 7, 0.0, -0.0, 0.1, -2.5, 1e20):
+        expected_to_base = (a + b * value) / (c + d * value)
+        expected_from_base = (a - c * value) / (d * value - b)
+        assert struct.pack("d", f_unit_to_base(value)) == struct.pack("d", expected_to_base)
+        assert struct.pack("d", f_base_to_unit(value)) == struct.pack("d", expected_from_base)
+        assert type(f_unit_to_base(value)) is float
+        assert type(f_base_to_unit(value)) is float
+
+
+def testMakeConversionPair() -> None:
+    from barril.units.posc import MakeConversionPair
+
+    f_base_to_unit, f_unit_to_base = MakeConversionPair(0.0, 0.3048, 1.0, 0.0)
+    assert f_unit_to_base(10) == approx(3.048)
+    assert f_base_to_unit(3.048) == approx(10)
+    assert f_base_to_unit.__b__ == f_unit_to_base.__b__ == 0.3048  # type:ignore[attr-defined]
+
+
+def testConversionFunctionsAreShared() -> None:
+    from barril.units.posc import MakeBaseToCustomary
+    from barril.units.posc import MakeConversionPair
+    from barril.units.posc import MakeCustomaryToBase
+
+    assert MakeCustomaryToBase(0.0, 0.001, 1.0, 0.0) is MakeCustomaryToBase(0.0, 0.001, 1.0, 0.0)
+    assert MakeBaseToCustomary(0.0, 0.001, 1.0, 0.0) is MakeBaseToCustomary(0.0, 0.001, 1.0, 0.0)
+    assert MakeConversionPair(0.0, 0.001, 1.0, 0.0) is MakeConversionPair(0.0, 0.001, 1.0, 0.0)
+    assert MakeCustomaryToBase(0.0, 0.001, 1.0, 0.0) is not MakeCustomaryToBase(0.0, 0.01, 1.0, 0.0)
+
+
+def testConversionFunctionsKeepCoefficientTypes(unit_database_posc) -> None:
+    """
+    The coefficients stored in the (cached) conversion functions must keep the type given for the
+    unit, even if another unit uses coefficients that compare equal (e.g.: 1 and 1.0 or 0.0 and
+    -0.0).
+    """
+    import math
+
+    from barril.units.posc import MakeConversionPair
+    from barril.units.posc import MakeCustomaryToBase
+
+    f_int, _ = MakeConversionPair(0.0, 86400, 1.0, 0.0)
+    f_float, _ = MakeConversionPair(0.0, 86400.0, 1.0, 0.0)
+    assert f_int is not f_float
+    assert type(f_int.__b__) is int  # type:ignore[attr-defined]
+    assert repr(f_int.__b__) == "86400"  # type:ignore[attr-defined]
+    assert type(f_float.__b__) is float  # type:ignore[attr-defined]
+    assert repr(f_float.__b__) == "86400.0"  # type:ignore[attr-defined]
+
+    f_positive_zero = MakeCustomaryToBase(0.0, 2.0, 1.0, 0.0)
+    f_negative_zero = MakeCustomaryToBase(-0.0, 2.0, 1.0, 0.0)
+    assert f_positive_zero is not f_negative_zero
+    assert repr(f_negative_zero.__a__) == "-0.0"  # type:ignore[attr-defined]
+    assert math.copysign(1.0, f_positive_zero(-0.0)) == 1.0
+    assert math.copysign(1.0, f_negative_zero(-0.0)) == -1.0
+
+    # Check the posc units themselves.
+    from barril.units.posc import _POSC_UNITS
+
+    for quantity_type, name, unit, a, b, c, d, default_category in _POSC_UNITS:
+        info = unit_database_posc.GetInfo(quantity_type, unit)
+        for f in (info.frombase, info.tobase):
+            coefficients = (f.__a__, f.__b__, f.__c__, f.__d__)  # type:ignore[attr-defined]
+            assert [repr(x) for x in coefficients] == [repr(x) for x in (a, b, c, d)], unit
+
+
+def testPoscNumpyConversion(unit_database_posc) -> None:
+    """
+    Numpy arrays are converted with the same functions used for scalars (applied to the whole
+    array at once), so the results must match the scalar conversion of each item.
+    """
+    import numpy
+
+    unit_database = unit_database_posc
+    values = [0.0, 1.0, -2.5, 0.1, 1e10]
+    array = numpy.array(values)
+    for quantity_type in unit_database.GetQuantityTypes():
+        base_unit = unit_database.GetBaseUnit(quantity_type)
+        for unit in unit_database.GetUnits(quantity_type):
+            for from_unit, to_unit in [(unit, base_unit), (base_unit, unit)]:
+                obtained = unit_database.Convert(quantity_type, from_unit, to_unit, array)
+                expected = [
+                    unit_database.Convert(quantity_type, from_unit, to_unit, v) for v in values
+                ]
+                assert obtained.tolist() == expected, (quantity_type, from_unit, to_unit)
+
+
+def testPoscCategoriesValidUnits(unit_database_posc) -> None:
+    """
+    Categories with the same valid units share them in the posc table, but each category must
+    still get its own list.
+    """
+    bulk_info = unit_database_posc.GetCategoryInfo("bulk compressibility")
+    compressibility_info = unit_database_posc.GetCategoryInfo("compressibility")
+    assert bulk_info.valid_units == compressibility_info.valid_units
+    assert bulk_info.valid_units is not compressibility_info.valid_units
+    assert isinstance(bulk_info.valid_units, list)
+    assert bulk_info.valid_units_set == set(bulk_info.valid_units)
+
+
+def testFillPoscOverridesForcePerVelocitySquared() -> None:
+    """
+    The "force per velocity squared" category is always overridden when filling the database,
+    even when the other categories are not.
+    """
+    from barril.units.posc import FillUnitDatabaseWithPosc
+
+    unit_database = UnitDatabase()
+    unit_database.AddUnitBase("my quantity type", "my unit", "my_unit")
+    unit_database.AddCategory("force per velocity squared", "my quantity type")
+    FillUnitDatabaseWithPosc(unit_database)
+    category_info = unit_database.GetCategoryInfo("force per velocity squared")
+    assert category_info.quantity_type == "force per velocity squared"
+
+    unit_database = UnitDatabase()
+    unit_database.AddUnitBase("my quantity type", "my unit", "my_unit")
+    unit_database.AddCategory("reluctance", "my quantity type")
+    with pytest.raises(units.UnitsError, match="category 'reluctance' already registered"):
+        FillUnitDatabaseWithPosc(unit_database)
@@ -1,3 +1,4 @@
+import math
 import pytest
 from pytest import approx
 
@@ -294,12 +295,28 @@ def testDiscoverCloseUnitMatches() -> None:
     assert unit_database.FindSimilarUnitMatches("mg/l") == ["mg/L"]
 
 
+def testFindSimilarUnitMatchesAfterAddingUnits(unit_database_len_time) -> None:
+    unit_database = unit_database_len_time
+    assert unit_database.FindSimilarUnitMatches("k") == ["km"]
+    unit_database.AddUnit("length", "kilofeet", "kft", "%f / 304.8", "%f * 304.8")
+    assert unit_database.FindSimilarUnitMatches("k") == ["kft", "km"]
+    assert unit_database.FindSimilarUnitMatches("k/s") == []
+
+
 def testDefaultCaption() -> None:
     unit_database = UnitDatabase.CreateDefaultSingleton()
     category_info = unit_database.GetCategoryInfo("angle per volume")
     assert category_info.caption == "Angle per Volume"
 
 
+def testCategoryInfoSlots(unit_database_len_time) -> None:
+    unit_database = unit_database_len_time
+    unit_database.AddCategory("my length", "length")
+    category_info = unit_database.GetCategoryInfo("my length")
+    assert not hasattr(category_info, "__dict__")
+    assert category_info.quantity_type == "length"
+
+
 def testAddCategoryBasedOnCategory(unit_database_custom_conversion) -> None:
     unit_database = unit_database_custom_conversion
     unit_database.AddCategory(
@@ -479,3 +496,101 @@ def testGetValidUnitsEmptyQuantity(unit_database_custom_conversion) -> None:
     unit_database = unit_database_custom_conversion
     quantity = Quantity.CreateEmpty()
     assert unit_database.GetValidUnits(quantity.GetCategory()) == []
+
+
+def testUnitInfoStrInfo(monkeypatch) -> None:
+    from barril.units.unit_database import UnitInfo
+
+    info = UnitInfo("length", "centimeters", "cm", "%f * 100.0", "%f / 100.0")
+    assert not hasattr(info, "__dict__")
+    assert not hasattr(info, "frombase_str")
+
+    monkeypatch.setattr(UnitInfo, "ADD_STR_INFO_TO_UNIT_INFO", True)
+    info = UnitInfo("length", "centimeters", "cm", "%f * 100.0", "%f / 100.0")
+    assert info.frombase_str == "%f * 100.0"
+    assert info.tobase_str == "%f / 100.0"
+    assert info.frombase(1.0) == 100.0
+
+
+def testAddUnitTwice(unit_database_len_time) -> None:
+    unit_database = unit_database_len_time
+    with pytest.raises(RuntimeError, match="Unit: km already added"):
+        unit_database.AddUnit("length", "kilometers", "km", "%f / 1000.0", "%f * 1000.0")
+    with pytest.raises(RuntimeError, match="Unit: km already added"):
+        unit_database.AddUnit("time", "kiloseconds", "km", "%f / 1000.0", "%f * 1000.0")
+    assert unit_database.GetUnits("length") == ["m", "mm", "cm", "km"]
+    assert unit_database.GetUnits("time") == ["s", "minutes"]
+
+
+def testAddUnits(unit_database_len_time) -> None:
+    unit_database = unit_database_len_time
+    unit_database.AddUnits(
+        [
+            ("length", "decimeters", "dm", "%f * 10.0", "%f / 10.0", None),
+            ("time", "hours", "h", "%f / 3600.0", "%f * 3600.0", "Time"),
+        ]
+    )
+    assert unit_database.GetUnits("length") == ["m", "mm", "cm", "km", "dm"]
+    assert unit_database.GetUnits("time") == ["s", "minutes", "h"]
+    assert unit_database.Convert("length", "m", "dm", 1.5) == 15.0
+    assert unit_database.Convert("time", "h", "s", 2.0) == 7200.0
+    assert unit_database.GetDefaultCategory("h") == "Time"
+
+    with pytest.raises(RuntimeError, match="Unit: dm already added"):
+        unit_database.AddUnits([("length", "decimeters", "dm", "%f * 10.0", "%f / 10.0", None)])
+
+
+def testConvertCacheIsClearedOnChanges(unit_database_len_time) -> None:
+    unit_database = unit_database_len_time
+    unit_database.AddCategory("my category", "length")
+    assert unit_database.Convert("my category", "m", "km", 1500.0) == 1.5
+
+    unit_database.AddCategory("my category", "time", override=True)
+    with pytest.raises(InvalidUnitError):
+        unit_database.Convert("my category", "m", "km", 1500.0)
+
+    unit_database.Clear()
+    unit_database.AddUnitBase("length", "meters", "m")
+    unit_database.AddUnit("length", "hectometers", "km", "%f / 100.0", "%f * 100.0")
+    assert unit_database.Convert("length", "m", "km", 1500.0) == 15.0
+
+
+def testBaseUnitsShareIdentity(unit_database_len_time) -> None:
+    unit_database = unit_database_len_time
+    length_info = unit_database.GetInfo("length", "m")
+    time_info = unit_database.GetInfo("time", "s")
+    assert length_info.tobase is length_info.frombase is time_info.tobase
+    assert not length_info.tobase.__has_conversion__  # type:ignore[attr-defined]
+    assert math.copysign(1.0, length_info.tobase(-0.0)) == -1.0
+    assert unit_database.Convert("length", "m", "km", 1) == 0.001
+
+
+def testConvertNumpyArrayCacheIsCleared(unit_database_len_time) -> None:
+    import numpy
+
+    unit_database = unit_database_len_time
+    values = numpy.array([1500.0, 3000.0])
+    assert unit_database.Convert("length", "m", "km", values).tolist() == [1.5, 3.0]
+
+    unit_database.Clear()
+    unit_database.AddUnitBase("length", "meters", "m")
+    unit_database.AddUnit("length", "hectometers", "km", "%f / 100.0", "%f * 100.0")
+    assert unit_database.Convert("length", "m", "km", values).tolist() == [15.0, 30.0]
+
+
+def testConvertWithCategoryNamedAsOtherQuantityType() -> None:
+    import numpy
+
+    unit_database = UnitDatabase()
+    unit_database.AddUnitBase("length", "meters", "m")
+    unit_database.AddUnit("length", "kilometers", "km", "%f / 1000.0", "%f * 1000.0")
+    unit_database.AddUnitBase("time", "seconds", "s")
+    unit_database.AddUnit("time", "minutes", "min", "%f / 60.0", "%f * 60.0")
+    unit_database.AddCategory("my length", "length")
+    # a category with the same name of a different quantity type
+    unit_database.AddCategory("length", "time")
+
+    assert unit_database.Convert("my length", "m", "km", 1500.0) == 1.5
+    assert unit_database.Convert("my length", "m", "km", numpy.array([1500.0])).tolist() == [1.5]
+    assert unit_database.Convert("length", "s", "min", 120.0) == 2.0
+    assert unit_database.Convert("length", "s", "min", numpy.array([120.0])).tolist() == [2.0]
@@ -3,6 +3,7 @@ from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Hashable
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
@@ -122,11 +123,34 @@ class ComposedUnitError(UnitsError):
 UnaryConversionFunc = Callable[[float], float]
 
 
+def _Identity(x: Any) -> Any:
+    """
+    Conversion function of the base units (shared by all of them).
+    """
+    return x
+
+
+_Identity.__has_conversion__ = False  # type:ignore[attr-defined]
+
+
 class UnitInfo:
     """
     Holds information about a unit type
     """
 
+    # There's one instance for each registered unit (more than 1500 with the posc units), so,
+    # use slots to keep them compact.
+    __slots__ = (
+        "name",
+        "unit",
+        "frombase",
+        "tobase",
+        "quantity_type",
+        "default_category",
+        "frombase_str",
+        "tobase_str",
+    )
+
     ADD_STR_INFO_TO_UNIT_INFO = False
 
     def __init__(
@@ -207,7 +231,7 @@ class UnitInfo:
         return self.unit == other.unit
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class CategoryInfo:
     """
     Holds information about a category
@@ -332,6 +356,10 @@ class UnitDatabase(Singleton):
     # see RegisterAdditionalConversionType
     _additional_conversions: Dict[Type, ConversionFunc] = {}
 
+    # The keys of _additional_conversions, kept as a tuple to be used with isinstance() in Convert
+    # (updated in RegisterAdditionalConversionType)
+    _additional_conversion_types: Tuple[Type, ...] = ()
+
     def __init__(self, default_singleton: bool = False):
         """
         Initializes the unit manager without any quantity types.
@@ -357,6 +385,17 @@ class UnitDatabase(Singleton):
         # Dictionary to cache whether a unit is valid in a category.
         self._category_unit_valid: Dict[Tuple[str, str], bool] = {}
 
+        # Dictionary to cache the functions used to convert between 2 units, as:
+        # (quantity_type, from_unit, to_unit) => (tobase, frombase)
+        # (must be cleared whenever units or categories are added).
+        self._conversion_cache: Dict[
+            Tuple[str, str, str], Tuple[UnaryConversionFunc, UnaryConversionFunc]
+        ] = {}
+
+        # Cache with the parts of each unit split by "." and "/" (lowercase), grouped by the number
+        # of parts, used by FindSimilarUnitMatches (must be reset whenever units are added).
+        self._unit_parts: Optional[Dict[int, List[Tuple[str, List[str]]]]] = None
+
         # dict of quantity_type => list of UnitInfo (the first unit in this list is the base unit for
         # the given quantity type)
         self.quantity_types: Dict[str, List[UnitInfo]] = {}
@@ -576,6 +615,7 @@ class UnitDatabase(Singleton):
         )
 
         self.categories_to_quantity_types[category] = info
+        self._conversion_cache.clear()
         return info
 
     def IsValidCategory(self, category: str) -> bool:
@@ -774,28 +814,51 @@ class UnitDatabase(Singleton):
         :param default_category:
             The default category for the added unit (if any).
         """
-        assert quantity_type is not None
-        if unit.__class__ != str:
-            raise TypeError("Only str is accepted. %s is not." % unit.__class__)
+        self.AddUnits([(quantity_type, name, unit, frombase, tobase, default_category)])
 
-        if unit is None:
-            unit = name
-        info = UnitInfo(
-            quantity_type, name, unit, frombase, tobase, default_category=default_category
-        )
-        if unit in self.unit_to_unit_info:
-            raise RuntimeError(
-                "Unit: %s already added to the unit database for the quantity type: %s (trying to add to: %s)"
-                % (unit, self.unit_to_unit_info[unit].quantity_type, quantity_type)
+    def AddUnits(
+        self,
+        rows: Iterable[
+            Tuple[
+                str,
+                str,
+                str,
+                Union[str, UnaryConversionFunc],
+                Union[str, UnaryConversionFunc],
+                Optional[str],
+            ]
+        ],
+    ) -> None:
+        """
+        Registers many unit types at once (faster than calling AddUnit() for each one).
+
+        :param rows:
+            An iterable of tuples with the same parameters accepted by AddUnit(), as
+            ``(quantity_type, name, unit, frombase, tobase, default_category)``.
+        """
+        self._conversion_cache.clear()
+        self._unit_parts = None
+        unit_to_unit_info = self.unit_to_unit_info
+        quantity_types = self.quantity_types
+        for quantity_type, name, unit, frombase, tobase, default_category in rows:
+            assert quantity_type is not None
+            if unit.__class__ != str:
+                raise TypeError("Only str is accepted. %s is not." % unit.__class__)
+
+            if unit in unit_to_unit_info:
+                raise RuntimeError(
+                    "Unit: %s already added to the unit database for the quantity type: %s (trying to add to: %s)"
+                    % (unit, unit_to_unit_info[unit].quantity_type, quantity_type)
+                )
+            info = UnitInfo(
+                quantity_type, name, unit, frombase, tobase, default_category=default_category
             )
-        else:
-            self.unit_to_unit_info[unit] = info
-        quantity_type_list = self.quantity_types.setdefault(quantity_type, [])
+            unit_to_unit_info[unit] = info
 
-        if unit in [q.unit for q in quantity_type_list]:
-            raise RuntimeError("Unit already registered: {} ({})".format(name, unit))
-
-        quantity_type_list.append(info)
+            # Note: no need to check whether the unit is already in the quantity type list (which
+            # would be linear on the number of units of the quantity type): all the units
+            # in `quantity_types` are also in `unit_to_unit_info`, checked above.
+            quantity_types.setdefault(quantity_type, []).append(info)
 
     def AddUnitBase(self, quantity_type: str, name: str, unit: str) -> None:
         """
@@ -803,12 +866,7 @@ class UnitDatabase(Singleton):
 
         Parameters have the same meaning as in AddUnit().
         """
-
-        def identity(x: Any) -> Any:
-            return x
-
-        identity.__has_conversion__ = False  # type:ignore[attr-defined]
-        self.AddUnit(quantity_type, name, unit, identity, identity)
+        self.AddUnit(quantity_type, name, unit, _Identity, _Identity)
         # move the base info to the first position
         # (that's a convention: the base is always in the first position)
         infos = self.quantity_types[quantity_type]
@@ -884,15 +942,22 @@ class UnitDatabase(Singleton):
         compiled = re.compile(r"[\./]")
         unit_split = compiled.split(unit.lower())
 
+        unit_parts = self._unit_parts
+        if unit_parts is None:
+            unit_parts = self._unit_parts = {}
+            for existing_unit in self.unit_to_unit_info.keys():
+                existing_unit_split = compiled.split(existing_unit.lower())
+                unit_parts.setdefault(len(existing_unit_split), []).append(
+                    (existing_unit, existing_unit_split)
+                )
+
         close_match = []
-        for existing_unit in self.unit_to_unit_info.keys():
-            existing_unit_split = compiled.split(existing_unit.lower())
-            if len(existing_unit_split) == len(unit_split):
-                for a, b in zip(existing_unit_split, unit_split):
-                    if not a.startswith(b) and not b.startswith(a):
-                        break
-                else:
-                    close_match.append(existing_unit)
+        for existing_unit, existing_unit_split in unit_parts.get(len(unit_split), []):
+            for a, b in zip(existing_unit_split, unit_split):
+                if not a.startswith(b) and not b.startswith(a):
+                    break
+            else:
+                close_match.append(existing_unit)
 
         return sorted(close_match)
 
@@ -1132,6 +1197,7 @@ class UnitDatabase(Singleton):
         """
         if class_ not in cls._additional_conversions:
             cls._additional_conversions[class_] = func
+            UnitDatabase._additional_conversion_types = tuple(cls._additional_conversions)
         else:
             assert (
                 cls._additional_conversions[class_] == func
@@ -1167,9 +1233,8 @@ class UnitDatabase(Singleton):
         :returns:
             The converted value
         """
-        supported_types = tuple(self._additional_conversions)
         convert_function: Optional[ConversionFunc] = None
-        if isinstance(value, supported_types):
+        if isinstance(value, self._additional_conversion_types):
             for key, convert_function in self._additional_conversions.items():
                 if isinstance(value, key):
                     break  # keep convert_function for later use
@@ -1217,20 +1282,37 @@ class UnitDatabase(Singleton):
         if convert_function is not None:
             return convert_function(self, quantity_type, from_unit, to_unit, value)
 
-        this = self.GetInfo(quantity_type, from_unit, fix_unknown=True)
-        other = self.GetInfo(quantity_type, to_unit, fix_unknown=True)
-
+        tobase, frombase = self._GetConversionFunctions(quantity_type, from_unit, to_unit)
         if isinstance(value, (float, int)):
-            return other.frombase(this.tobase(value))
+            return frombase(tobase(value))
         else:  # list / tuple
-            frombase = other.frombase
-            tobase = this.tobase
-            values_gen = (frombase(tobase(v)) for v in value)
+            # Note: a list comprehension avoids resuming a generator for each item.
+            values = [frombase(tobase(v)) for v in value]
 
             if isinstance(value, tuple):
-                return tuple(values_gen)
+                return tuple(values)
             else:
-                return list(values_gen)
+                return values
+
+    def _GetConversionFunctions(
+        self, quantity_type: str, from_unit: str, to_unit: str
+    ) -> Tuple[UnaryConversionFunc, UnaryConversionFunc]:
+        """
+        :param quantity_type:
+            The quantity type of the units (already resolved, i.e.: not a category).
+
+        :returns:
+            The functions to convert a value from `from_unit` to the base unit and from the base
+            unit to `to_unit` (cached, as they're needed on each conversion).
+        """
+        cache_key = (quantity_type, from_unit, to_unit)
+        try:
+            return self._conversion_cache[cache_key]
+        except KeyError:
+            this = self.GetInfo(quantity_type, from_unit, fix_unknown=True)
+            other = self.GetInfo(quantity_type, to_unit, fix_unknown=True)
+            result = self._conversion_cache[cache_key] = (this.tobase, other.frombase)
+            return result
 
     def Clear(self) -> None:
         """
@@ -1241,6 +1323,8 @@ class UnitDatabase(Singleton):
         self.unit_to_unit_info.clear()
         self.quantities_cache.clear()
         self._category_unit_valid.clear()
+        self._conversion_cache.clear()
+        self._unit_parts = None
 
     # Operations with different quantities ---------------------------------------------------------
     def _DoOperationWithSameQuantity(
@@ -1472,11 +1556,7 @@ class RegisterConversion:
             Converts the given numpy array by applying the conversion as if it was a scalar,
             since arrays support the numeric operators, which are applied element-wise.
             """
-            from_unit_info = db.GetInfo(quantity_type, from_unit, fix_unknown=True)
-            to_unit_info = db.GetInfo(quantity_type, to_unit, fix_unknown=True)
-
-            to_base = from_unit_info.tobase
-            from_base = to_unit_info.frombase
+            to_base, from_base = db._GetConversionFunctions(quantity_type, from_unit, to_unit)
             return from_base(to_base(array))
 
         UnitDatabase.RegisterAdditionalConversionType(numpy.ndarray, ConvertNumpyArray)